@@ -1,5 +1,8 @@
+from functools import lru_cache
 from pathlib import Path
 from PIL import Image, ImageDraw, ImageFont
+from PIL.PngImagePlugin import PngInfo
+import hashlib
 import textwrap
 import random
 
@@ -30,11 +33,13 @@ def wrap_text(text, width):
     return textwrap.wrap(text, width=width)
 
 
+@lru_cache(maxsize=None)
 def load_font(size: int):
     """
     GitHub Actions 환경에서도 돌아가도록:
     1순위: DejaVuSans
     2순위: 기본 폰트
+    (크기별로 한 번만 읽음 — 카드를 여러 장 만들 때 폰트 파일을 매번 다시 열지 않음)
     """
     try:
         return ImageFont.truetype("DejaVuSans.ttf", size)
@@ -56,6 +61,21 @@ def make_cardnews_image(card_text: str, out_path):
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
+    from datetime import datetime
+    today_str = datetime.now().strftime("%Y-%m-%d")
+
+    # 같은 날짜·같은 문구로 이미 만든 카드가 있으면 다시 그리지 않음
+    # (tEXt 청크는 IDAT 앞에 기록되므로 open() 시점의 info만 보면 되고 픽셀은 디코딩하지 않음)
+    card_hash = hashlib.blake2b(f"{today_str}\n{card_text}".encode("utf-8"), digest_size=16).hexdigest()
+    if out_path.exists():
+        try:
+            with Image.open(out_path) as old:
+                if old.info.get("card_hash") == card_hash:
+                    print(f"[CARD] 변경 없음, 생성 생략 → {out_path}")
+                    return
+        except Exception:
+            pass
+
     # --- 캔버스 기본 설정 (정사각형 카드) ---
     W, H = 900, 900
     img = Image.new("RGB", (W, H), "#101018")
@@ -92,8 +112,6 @@ def make_cardnews_image(card_text: str, out_path):
     )
 
     # 날짜 뱃지
-    from datetime import datetime
-    today_str = datetime.now().strftime("%Y-%m-%d")
     date_text = f"🗓 {today_str}"
     dw, dh = get_text_size(draw, date_text, font=small_font)
     draw.rounded_rectangle(
@@ -178,6 +196,8 @@ def make_cardnews_image(card_text: str, out_path):
         fill="#6b76c9",
     )
 
-    # 파일 저장
-    img.save(out_path, format="PNG")
+    # 파일 저장 (다음 실행에서 변경 여부를 판단할 해시를 함께 기록)
+    meta = PngInfo()
+    meta.add_text("card_hash", card_hash)
+    img.save(out_path, format="PNG", pnginfo=meta)
     print(f"[CARD] 카드뉴스 생성 완료 → {out_path}")
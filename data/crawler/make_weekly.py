@@ -1,3 +1,4 @@
+import heapq
 import json
 import re
 from collections import Counter, defaultdict
@@ -6,6 +7,11 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from zoneinfo import ZoneInfo
 
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경(로컬 실행 등)은 표준 json으로 동작
+    orjson = None
+
 # =========================
 # 설정
 # =========================
@@ -22,6 +28,10 @@ TOP_KEYWORDS_N = 10
 
 SOURCE_PRIORITY = ["에너지신문", "가스신문", "전기신문"]
 
+WS_RE = re.compile(r"\s+")
+# strptime("%Y-%m-%d")와 같은 입력 범위 (월/일 한 자리, 일 앞 공백 허용)
+YMD_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}| [1-9])")
+
 
 # =========================
 # 유틸
@@ -35,14 +45,17 @@ def today_str_kst() -> str:
 def parse_date_yyyy_mm_dd(s: str) -> datetime | None:
     if not s:
         return None
-    s = str(s).strip()
+    # all.json 기사마다 호출되므로 strptime 대신 정규식 + datetime()으로 직접 생성
+    m = YMD_RE.fullmatch(str(s).strip())
+    if not m:
+        return None
     try:
-        return datetime.strptime(s, "%Y-%m-%d")
+        return datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)))
     except ValueError:
         return None
 
 def normalize_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return WS_RE.sub(" ", (text or "")).strip()
 
 def safe_list(x):
     return x if isinstance(x, list) else []
@@ -62,7 +75,8 @@ def pick_top_articles(items: list[dict], n: int) -> list[dict]:
     def key(a):
         tags_len = len(safe_list(a.get("tags")))
         return (-tags_len, source_rank(a.get("source", "")), a.get("title", ""))
-    return sorted(items, key=key)[:n]
+    # 전체 정렬 없이 상위 n개만 부분 선택 (sorted(...)[:n]과 결과 동일)
+    return heapq.nsmallest(n, items, key=key)
 
 def one_liner(range_from: str, range_to: str, total: int, by_source: list[dict], top_keywords: list[dict], by_day: list[dict]) -> str:
     if total <= 0:
@@ -89,6 +103,8 @@ def load_all() -> list[dict]:
     if not ALL_JSON_PATH.exists():
         return []
     try:
+        if orjson is not None:
+            return orjson.loads(ALL_JSON_PATH.read_bytes())
         return json.loads(ALL_JSON_PATH.read_text(encoding="utf-8"))
     except Exception:
         return []
@@ -256,11 +272,14 @@ def main():
     all_items = load_all()
     weekly = build_weekly_json(all_items)
 
-    # weekly.json 저장
-    WEEKLY_JSON_PATH.write_text(
-        json.dumps(weekly, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+    # weekly.json 저장 (orjson 출력은 json.dumps(ensure_ascii=False, indent=2)와 바이트 단위로 같음)
+    if orjson is not None:
+        WEEKLY_JSON_PATH.write_bytes(orjson.dumps(weekly, option=orjson.OPT_INDENT_2))
+    else:
+        WEEKLY_JSON_PATH.write_text(
+            json.dumps(weekly, ensure_ascii=False, indent=2),
+            encoding="utf-8"
+        )
 
     # weekly_prompt.txt 저장
     prompt_txt = build_weekly_prompt_txt(weekly)
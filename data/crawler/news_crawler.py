@@ -1,11 +1,32 @@
 import json
+import os
 import re
-from datetime import datetime
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from urllib.parse import urljoin
 from zoneinfo import ZoneInfo
 
 import requests
-from bs4 import BeautifulSoup
+import soupsieve as sv
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 환경(로컬 실행 등)은 표준 json으로 동작
+    orjson = None
+
+try:
+    import lxml  # noqa: F401  (bs4가 이름으로 찾아 씀)
+    HTML_PARSER = "lxml"
+except ImportError:  # lxml 미설치 환경(로컬 실행 등)은 내장 html.parser로 동작 (더 느림)
+    HTML_PARSER = "html.parser"
 
 # ==========================================
 # 1. 설정
@@ -15,8 +36,23 @@ KST = ZoneInfo("Asia/Seoul")
 TIMEOUT = 15
 MAX_PAGES = 3
 DEBUG = True
+DETAIL_WORKERS = 8  # 언론사(호스트)별 상세 페이지 동시 요청 수
 
-KEYWORDS_ANY = [
+# all.json에 이미 있는 기사는 상세 페이지를 다시 받지 않음.
+# 키워드 목록을 바꿔 기존 기사까지 다시 태깅하려면 REFRESH=1 로 실행.
+REFRESH = os.environ.get("REFRESH") == "1"
+
+# 본문까지 받아 봤지만 키워드가 없어 버린 기사도 URL을 남겨 다음 실행에서 다시 받지 않음.
+# (목록 1~3페이지는 전날과 겹치는 기사가 많음) 파일이 계속 커지지 않도록 최근 것만 보관.
+REJECTED_MAX = 3000
+
+# 목록(제목+리드)에서 키워드가 안 걸린 기사도 상세 본문을 받아 다시 판단할지 여부.
+# 수집분 중 제목만으로 걸리는 기사는 1/3 남짓이라 기본은 True.
+# False(FETCH_BODY_ALWAYS=0)로 두면 상세 요청이 크게 줄지만 본문에서만 키워드가 나오는 기사는 놓친다.
+# 놓치는 규모는 페이지별 로그의 "본문에서만 매칭" 건수로 확인.
+FETCH_BODY_ALWAYS = os.environ.get("FETCH_BODY_ALWAYS", "1") != "0"
+
+KEYWORDS_ANY = (
     "수소", "연료전지", "그린수소", "청정수소", "블루수소", "원자력",
     "PAFC", "SOFC", "MCFC", "PEM", "재생에너지", "배출권", "히트펌프", "도시가스", "구역전기", "PPA",
     "수전해", "전해조", "PEMEC", "AEM", "알카라인", "분산형전원", "NDC", "핑크수소",
@@ -29,9 +65,9 @@ KEYWORDS_ANY = [
     "수소법개정", "IRA", "수소안전", "수용성", "ORC", "SOEC", "스마트팜",
     "바이오가스", "해외태양광", "북미풍력", "북해풍력", "인도네시아", "수소경제",
     "LCA", "전과정평가", "수소수입", "암모니아수입", "Hydrogen Bank", "IPCEI",
-]
+)
 
-REGIONS = ["호주", "영국", "칠레", "북미", "미국", "북해", "인도네시아"]
+REGIONS = ("호주", "영국", "칠레", "북미", "미국", "북해", "인도네시아")
 
 KEYWORDS_RULES = [
     {"must": ["수소"], "any": REGIONS},
@@ -43,6 +79,16 @@ KEYWORDS_RULES = [
     {"must": ["수소"], "any": ["포럼", "세미나", "심포지엄"]},
 ]
 
+# 키워드는 고정이므로 소문자 변환을 import 시 한 번만 수행
+# 태그는 이 튜플의 문자열을 그대로 쓰므로, 기존 all.json에서 읽은 태그와 같은 객체가 되도록 intern
+KEYWORDS_ANY = tuple(sys.intern(k) for k in KEYWORDS_ANY)
+KEYWORDS_ANY_LOWER = tuple(k.lower() for k in KEYWORDS_ANY)
+
+KEYWORDS_RULES_LOWER = tuple(
+    (frozenset(m.lower() for m in r["must"]), frozenset(a.lower() for a in r["any"]))
+    for r in KEYWORDS_RULES
+)
+
 DATA_DIR = Path("data")
 BY_DATE_DIR = DATA_DIR / "by_date"
 DATA_DIR.mkdir(exist_ok=True)
@@ -50,6 +96,7 @@ BY_DATE_DIR.mkdir(exist_ok=True)
 
 ALL_JSON_PATH = DATA_DIR / "all.json"
 LATEST_JSON_PATH = DATA_DIR / "latest.json"
+REJECTED_JSON_PATH = DATA_DIR / "rejected_urls.json"
 
 ENERGY_BASE = "https://www.energy-news.co.kr"
 GAS_BASE = "https://www.gasnews.com"
@@ -59,41 +106,154 @@ ENERGY_LIST = ENERGY_BASE + "/news/articleList.html?page={page}&view_type=sm"
 GAS_LIST = GAS_BASE + "/news/articleList.html?page={page}&view_type=sm"
 ELECT_LIST = ELECT_BASE + "/news/articleList.html?page={page}&view_type=sm"
 
+# 수집 대상 언론사 (목록 URL, 출처명) — 세 곳 모두 같은 CMS라 crawl_list 하나로 처리
+# 새 언론사도 같은 CMS면 여기에 한 줄만 추가
+SOURCES = (
+    (ENERGY_LIST, "에너지신문"),
+    (GAS_LIST, "가스신문"),
+    (ELECT_LIST, "전기신문"),
+)
+
+# Accept-Encoding은 requests 기본값을 그대로 씀 (brotli 패키지가 설치돼 있으면 br도 자동으로 요청)
+HEADERS = {
+    "User-Agent": "Mozilla/5.0",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+# 세 언론사 호스트에 목록+상세 요청이 몰리므로 keep-alive 커넥션을 재사용
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=8,  # 호스트별 커넥션 풀 개수 (언론사 3곳 + 리다이렉트 여유)
+    # 한 호스트에는 그 언론사의 상세 풀(DETAIL_WORKERS)만 동시에 요청하므로 같은 수만 보관하면 충분.
+    # 이보다 작으면 동시에 열린 커넥션 일부가 반납 시 버려져 keep-alive가 끊김
+    pool_maxsize=DETAIL_WORKERS,
+    # 429(요청 과다)도 재시도 대상. 대기는 backoff(0 → 0.6초)만 따르고 Retry-After 헤더는 무시
+    # (서버가 Retry-After: 600 같은 값을 주면 상세 워커가 통째로 멈춰 하루 실행이 몇 시간씩 늘어남)
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504],
+                      respect_retry_after_header=False),
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# 목록 페이지는 #section-list 하위만 트리로 만든다 (헤더/사이드바/광고 파싱 생략)
+LIST_STRAINER = SoupStrainer(id="section-list")
+
+# 기사 상세는 meta 태그와 본문 컨테이너만 따로 트리로 만든다
+# (둘 중 하나라도 못 찾으면 전체 파싱으로 기존 탐색 순서를 그대로 따름)
+META_STRAINER = SoupStrainer("meta")
+# BODY_CONTAINERS 우선순위 1·2위 id만 포함 (같은 id의 <article> 등도 트리에 남지만 extract_body_text가 div만 인정)
+BODY_STRAINER = SoupStrainer(id=["article-view-content-div", "articleBody"])
+
+# CSS 선택자는 import 시 한 번만 컴파일해 기사/목록 항목마다 재사용
+SEL_LIST_ITEMS = sv.compile("#section-list .type1 li")
+SEL_LIST_ITEMS_FALLBACK = sv.compile("#section-list li")
+SEL_TITLE_LINK = sv.compile("h2.titles a, h4.titles a, a.replace-titles, a[href*='articleView.html']")
+SEL_TITLES = sv.compile(".titles")
+SEL_LEAD = sv.compile("p.lead")
+SEL_LIST_DATE = sv.compile("em.info.dated, em.replace-date, span.byline span")
+
+SEL_SCRIPT_BLOCKS = sv.compile("script, style, iframe, noscript")
+SEL_AD_BLOCKS = sv.compile("[id^='AD'], .ad-template, .banner_box, .AD, .adsbygoogle")
+SEL_ELECTIMES_SNS = sv.compile(".sns, .share, .article-share, .utility, .view-sns, .article-sns, .article-view-sns")
+SEL_SUBHEADING = sv.compile("h4.subheading")
+SEL_P = sv.compile("p")
+
+# 우선순위 순서대로 시도 (먼저 걸리는 것 사용)
+SEL_PUBLISHED_DATE = tuple(sv.compile(sel) for sel in (
+    "span.updated", "span.published", "span.date", "em.info.dated", "li.date", "p.date",
+    "div.article-head em", "div.article-head span",
+    "div.view-head em", "div.view-head span",
+))
+
+# 본문 컨테이너는 id/class 하나로 찾으므로 CSS 엔진 대신 find()로 직접 탐색 (우선순위 순서)
+BODY_CONTAINERS = (
+    ("div", {"id": "article-view-content-div"}),
+    ("div", {"id": "articleBody"}),
+    ("div", {"class": "article-body"}),
+    ("div", {"class": "article-text"}),
+    ("article", {}),
+    ("div", {"id": "articleBodyContents"}),
+)
+
 EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+WS_RE = re.compile(r"\s+")
+# "다." 뒤는 공백이 없어도 끊고, 그 밖의 . ! ? 는 뒤에 공백이 있을 때만 끊음
+SENT_SPLIT_RE = re.compile(r"(?<=다\.)\s*|(?<=[.!?])\s+")
+COPYRIGHT_RE = re.compile(r"무단전재\s*및\s*재배포\s*금지")
+REPORTER_RE = re.compile(r"[가-힣]{2,4}\s*기자")
+EULO_RE = re.compile(r"\(\s*\)\s*\(으\)로|\(으\)로")
+ISO_DATE_RE = re.compile(r"(\d{4}-\d{2}-\d{2})")
+# 상세 페이지 발행일 meta 후보 (우선순위 순)
+META_PUBLISHED_KEYS = (
+    ("property", "article:published_time"),
+    ("name", "article:published_time"),
+    ("property", "og:updated_time"),
+    ("name", "og:updated_time"),
+)
+LOOSE_DATE_RE = re.compile(r"(\d{4}[.-]\d{2}[.-]\d{2})")
+# "YYYY.MM.DD [HH:MM]", "YYYY-MM-DD [HH:MM]", 연도 없는 "MM.DD [HH:MM]" (기존 strptime 포맷과 동일한 범위)
+FLEX_DATE_RE = re.compile(
+    r"(?:(?P<y>\d{4})(?P<sep>[.-]))?(?P<mo>\d{1,2})(?(sep)(?P=sep)|\.)(?P<d>\d{1,2}| [1-9])"
+    r"(?:\s+(?P<h>\d{1,2}):(?P<mi>\d{1,2}))?"
+)
+
+# 전기신문 본문에 섞여 들어오는 공유/버튼 문구
+# (문구 안의 공백은 \s+로 받아서 공백 정리 전 텍스트에도 그대로 적용됨)
+def _noise_re(*phrases: str) -> re.Pattern:
+    return re.compile("|".join(r"\s+".join(map(re.escape, ph.split())) for ph in phrases))
+
+# 문구를 순서대로 하나씩 지우던 방식과 결과를 맞추려고 두 번에 나눠 치환.
+# "기사스크랩"은 "닫기"·"바로가기"·"…키우기"·"…줄이기"와 "기"가 겹치는데("닫기사스크랩"),
+# 한 정규식으로 묶으면 왼쪽에서 먼저 맞는 "닫기"가 이겨 "사스크랩"이 남음 → 먼저 지워야 함.
+# 각 묶음 안의 문구끼리는 겹치는 글자가 없어 한 번에 치환해도 순서 영향이 없음
+ELECTIMES_NOISE_RES = (
+    _noise_re("카카오스토리", "네이버블로그", "URL복사", "기사스크랩"),
+    _noise_re(
+        "본문 글씨 키우기", "본문 글씨 줄이기",
+        "닫기", "바로가기",
+        "공유", "제보", "트위터", "페이스북", "카카오톡", "밴드",
+    ),
+)
+
+# 정렬 키: 날짜 → 중요도 → 신문사 → 제목 (itemgetter는 C 구현이라 lambda보다 빠름)
+ARTICLE_SORT_KEY = itemgetter("date", "is_important", "source", "title")
 
 
 # ==========================================
 # 2. 키워드 매칭 함수 (추가/교체)
 # ==========================================
 
-def match_any(text: str, keywords: list[str]) -> bool:
-    low = (text or "").lower()
-    return any(k.lower() in low for k in keywords)
-
-def match_rules(text: str, rules: list[dict]) -> bool:
-    low = (text or "").lower()
-    for r in rules:
-        must_ok = all(m.lower() in low for m in r["must"])
-        any_ok = any(a.lower() in low for a in r["any"])
-        if must_ok and any_ok:
+def match_any(text: str, keywords, lowered: bool = False) -> bool:
+    """keywords: 소문자로 정규화된 키워드 (KEYWORDS_ANY_LOWER)
+    lowered=True면 text가 이미 소문자라고 보고 lower()를 생략"""
+    low = text if lowered else (text or "").lower()
+    return any(k in low for k in keywords)
+
+def match_rules(text: str, rules, lowered: bool = False) -> bool:
+    """rules: KEYWORDS_RULES_LOWER 형태의 (must, any) 소문자 키워드 묶음"""
+    low = text if lowered else (text or "").lower()
+    for must, any_ in rules:
+        if all(m in low for m in must) and any(a in low for a in any_):
             return True
     return False
 
 def is_relevant(title: str, body: str) -> bool:
-    text = f"{title} {body}"
-    return match_any(text, KEYWORDS_ANY) or match_rules(text, KEYWORDS_RULES)
+    low = f"{title} {body}".lower()
+    return (match_any(low, KEYWORDS_ANY_LOWER, lowered=True)
+            or match_rules(low, KEYWORDS_RULES_LOWER, lowered=True))
 
-def make_tags(text: str) -> list[str]:
+def make_tags(text: str, lowered: bool = False) -> list[str]:
     """기본 키워드(KEYWORDS_ANY) 중 실제 매칭된 것만 태그로 저장"""
-    low = (text or "").lower()
-    seen = set()
-    out = []
-    for k in KEYWORDS_ANY:
-        kl = k.lower()
-        if kl in low and k not in seen:
-            seen.add(k)
-            out.append(k)
-    return out
+    low = text if lowered else (text or "").lower()
+    return list(dict.fromkeys(k for k, kl in zip(KEYWORDS_ANY, KEYWORDS_ANY_LOWER) if kl in low))
+
+def scan_keywords(title: str, body: str) -> tuple[bool, list[str]]:
+    """is_relevant()와 make_tags()를 한 번의 키워드 스캔으로 처리: (관련 여부, 태그)"""
+    # 본문 전체를 소문자로 복사하는 건 한 번만
+    low = f"{title} {body}".lower()
+    tags = make_tags(low, lowered=True)
+    return bool(tags) or match_rules(low, KEYWORDS_RULES_LOWER, lowered=True), tags
 
 
 # ==========================================
@@ -110,68 +270,72 @@ def now_str():
     return kst_now().strftime("%Y-%m-%d %H:%M:%S")
 
 def normalize_spaces(text: str) -> str:
-    return re.sub(r"\s+", " ", (text or "")).strip()
+    return WS_RE.sub(" ", (text or "")).strip()
 
-def get_soup(url: str):
-    headers = {
-        "User-Agent": "Mozilla/5.0",
-        "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
-    }
+def fetch_html(url: str) -> tuple[bytes, str | None] | None:
+    """(응답 바이트, 헤더에 명시된 charset) — 디코딩은 파서(lxml)에 맡김"""
     try:
-        r = requests.get(url, headers=headers, timeout=TIMEOUT)
+        r = SESSION.get(url, timeout=TIMEOUT)
         r.raise_for_status()
-        return BeautifulSoup(r.text, "html.parser")
+        # charset이 헤더에 있으면 그대로 넘겨 bs4의 인코딩 추측(charset_normalizer)을 건너뜀
+        # (헤더에 없을 때 requests가 채우는 ISO-8859-1 기본값은 쓰지 않음)
+        charset = r.encoding if "charset=" in r.headers.get("Content-Type", "").lower() else None
+        return r.content, charset
     except Exception as e:
         print(f"[ERROR] GET 실패: {url} → {e}")
         return None
 
-def parse_date_flexible(raw: str) -> str | None:
-    raw = (raw or "").strip()
-    if not raw:
+def get_soup(url: str, parse_only: SoupStrainer | None = None):
+    fetched = fetch_html(url)
+    if fetched is None:
+        return None
+    html, charset = fetched
+    try:
+        return BeautifulSoup(html, HTML_PARSER, parse_only=parse_only, from_encoding=charset)
+    except Exception as e:
+        # 파싱 오류도 요청 실패처럼 그 페이지만 건너뜀 (예외가 crawl_list 밖으로 나가면 전체 실행이 중단됨)
+        print(f"[ERROR] 파싱 실패: {url} → {e}")
         return None
 
-    for fmt in ("%Y.%m.%d %H:%M", "%Y.%m.%d", "%Y-%m-%d", "%Y-%m-%d %H:%M"):
-        try:
-            return datetime.strptime(raw, fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            pass
-
-    year = kst_now().year
-    for fmt in ("%Y.%m.%d %H:%M", "%Y.%m.%d"):
-        try:
-            return datetime.strptime(f"{year}.{raw}", fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            pass
+def parse_date_flexible(raw: str) -> str | None:
+    m = FLEX_DATE_RE.fullmatch((raw or "").strip())
+    if not m:
+        return None
 
-    return None
+    y, mo, d, h, mi = m.group("y", "mo", "d", "h", "mi")
+    if h is not None and (int(h) > 23 or int(mi) > 59):
+        return None
+    try:
+        # date()가 월/일 범위(2월 30일 등)를 strptime과 똑같이 검증
+        return date(int(y) if y else kst_now().year, int(mo), int(d)).isoformat()
+    except ValueError:
+        return None
 
-def split_sentences_ko(text: str) -> list[str]:
+def split_sentences_ko(text: str, normalized: bool = False, limit: int = 0) -> list[str]:
+    """normalized=True면 이미 normalize_spaces()를 거친 text로 보고 공백 정리를 생략
+    limit>0이면 앞에서부터 limit개 문장까지만 자름"""
     if not text:
         return []
-    s = normalize_spaces(text)
-    s = s.replace("다. ", "다.\n").replace("다.", "다.\n")
-    parts = re.split(r"(?<=[.!?])\s+", s)
-    out = []
-    for p in parts:
-        for seg in p.split("\n"):
-            seg = seg.strip()
-            if seg:
-                out.append(seg)
-    return out
-
-def summarize_2lines(body: str) -> str:
-    sents = split_sentences_ko(body)
-    if not sents:
-        return ""
-    return normalize_spaces(" ".join(sents[:2]))
+    s = text if normalized else normalize_spaces(text)
+    # 빈 조각은 끝에 "다."로 끝날 때만 생김
+    parts = SENT_SPLIT_RE.split(s, maxsplit=limit)
+    if limit:
+        parts = parts[:limit]
+    return [p for p in parts if p]
+
+def summarize_2lines(body: str, normalized: bool = False) -> str:
+    # 문장은 공백 정리된 문자열을 공백 기준으로 자른 조각이라 다시 붙여도 이미 정리된 상태
+    return " ".join(split_sentences_ko(body, normalized, limit=2))
 
 
 # ==========================================
 # 4. 제목 누락 방지(목록 li에서 title robust 추출)
 # ==========================================
 
-def extract_title_from_li(li) -> str:
-    a = li.select_one("h2.titles a, h4.titles a, a.replace-titles, a[href*='articleView.html']")
+def extract_title_from_li(li, a=None) -> str:
+    """a: 호출 측에서 이미 찾은 제목 링크 (있으면 다시 찾지 않음)"""
+    if a is None:
+        a = SEL_TITLE_LINK.select_one(li)
     if not a:
         return ""
 
@@ -186,7 +350,7 @@ def extract_title_from_li(li) -> str:
                     break
 
     if not t:
-        titles_node = li.select_one(".titles")
+        titles_node = SEL_TITLES.select_one(li)
         if titles_node:
             t = normalize_spaces(titles_node.get_text(" ", strip=True))
 
@@ -203,39 +367,28 @@ def extract_title_from_li(li) -> str:
 def remove_common_blocks(root_tag):
     if not root_tag:
         return
-    for t in root_tag.select("script, style, iframe, noscript"):
+    for t in SEL_SCRIPT_BLOCKS.select(root_tag):
         t.decompose()
-    for t in root_tag.select("[id^='AD'], .ad-template, .banner_box, .AD, .adsbygoogle"):
+    for t in SEL_AD_BLOCKS.select(root_tag):
         t.decompose()
 
+# 정제 정규식은 모두 공백을 \s*/\s+로 받으므로 공백 정리(normalize_spaces)는 호출 측에서 마지막에 한 번만 함
+
 def clean_common_noise(text: str) -> str:
-    s = normalize_spaces(text)
-    s = re.sub(r"무단전재\s*및\s*재배포\s*금지", " ", s)
-    s = EMAIL_RE.sub(" ", s)
-    return normalize_spaces(s)
+    s = COPYRIGHT_RE.sub(" ", text)
+    return EMAIL_RE.sub(" ", s)
 
 def remove_electimes_blocks(article_tag):
     remove_common_blocks(article_tag)
-    for t in article_tag.select(".sns, .share, .article-share, .utility, .view-sns, .article-sns, .article-view-sns"):
+    for t in SEL_ELECTIMES_SNS.select(article_tag):
         t.decompose()
 
 def clean_electimes_noise_text(text: str) -> str:
-    s = normalize_spaces(text)
-    s = EMAIL_RE.sub(" ", s)
-    s = re.sub(r"[가-힣]{2,4}\s*기자", " ", s)
-
-    noise_phrases = [
-        "카카오스토리", "네이버블로그", "URL복사", "기사스크랩",
-        "본문 글씨 키우기", "본문 글씨 줄이기",
-        "닫기", "바로가기",
-        "공유", "제보", "트위터", "페이스북", "카카오톡", "밴드",
-    ]
-    for ph in noise_phrases:
-        s = s.replace(ph, " ")
-
-    s = re.sub(r"\(\s*\)\s*\(으\)로", " ", s)
-    s = re.sub(r"\(으\)로", " ", s)
-    return normalize_spaces(s)
+    s = EMAIL_RE.sub(" ", text)
+    s = REPORTER_RE.sub(" ", s)
+    for noise_re in ELECTIMES_NOISE_RES:
+        s = noise_re.sub(" ", s)
+    return EULO_RE.sub(" ", s)
 
 
 # ==========================================
@@ -243,34 +396,30 @@ def clean_electimes_noise_text(text: str) -> str:
 # ==========================================
 
 def extract_published_date_from_article(soup: BeautifulSoup) -> str | None:
-    meta_candidates = [
-        ("meta", {"property": "article:published_time"}),
-        ("meta", {"name": "article:published_time"}),
-        ("meta", {"property": "og:updated_time"}),
-        ("meta", {"name": "og:updated_time"}),
-    ]
-    for tag, attrs in meta_candidates:
-        m = soup.find(tag, attrs=attrs)
-        if m and m.get("content"):
-            content = m.get("content").strip()
-            m2 = re.search(r"(\d{4}-\d{2}-\d{2})", content)
+    # meta 태그는 한 번만 훑고, 후보별 첫 태그의 content를 우선순위대로 확인
+    # (후보마다 soup.find()로 트리를 다시 도는 것과 결과 동일)
+    found = {}
+    for m in soup.find_all("meta"):
+        for attr in ("property", "name"):
+            key = (attr, m.get(attr))
+            if key in META_PUBLISHED_KEYS and key not in found:
+                found[key] = m.get("content")
+    for key in META_PUBLISHED_KEYS:
+        content = found.get(key)
+        if content:
+            m2 = ISO_DATE_RE.search(content.strip())
             if m2:
                 return m2.group(1)
 
-    sel_candidates = [
-        "span.updated", "span.published", "span.date", "em.info.dated", "li.date", "p.date",
-        "div.article-head em", "div.article-head span",
-        "div.view-head em", "div.view-head span",
-    ]
-    for sel in sel_candidates:
-        el = soup.select_one(sel)
+    for sel in SEL_PUBLISHED_DATE:
+        el = sel.select_one(soup)
         if el:
             dt = parse_date_flexible(el.get_text(" ", strip=True))
             if dt:
                 return dt
 
     text = soup.get_text(" ", strip=True)
-    m3 = re.search(r"(\d{4}[.-]\d{2}[.-]\d{2})", text)
+    m3 = LOOSE_DATE_RE.search(text)
     if m3:
         dt = parse_date_flexible(m3.group(1).replace("-", "."))
         if dt:
@@ -278,20 +427,16 @@ def extract_published_date_from_article(soup: BeautifulSoup) -> str | None:
 
     return None
 
-def extract_body_from_article(url: str, source: str) -> tuple[str, str | None]:
-    soup = get_soup(url)
-    if not soup:
-        return "", None
-
-    published = extract_published_date_from_article(soup)
-
+def extract_body_text(soup: BeautifulSoup, source: str, require_container: bool = False) -> str | None:
+    """require_container=True면 본문 컨테이너를 못 찾았을 때 None 반환"""
     if source == "전기신문":
-        article_tag = soup.select_one("article#article-view-content-div") or soup.select_one("div#article-view-content-div")
+        article_tag = (soup.find("article", id="article-view-content-div")
+                       or soup.find("div", id="article-view-content-div"))
         if article_tag:
             remove_electimes_blocks(article_tag)
 
             parts = []
-            sub = article_tag.select_one("h4.subheading")
+            sub = SEL_SUBHEADING.select_one(article_tag)
             if sub:
                 parts.append(sub.get_text(" ", strip=True))
 
@@ -300,22 +445,17 @@ def extract_body_from_article(url: str, source: str) -> tuple[str, str | None]:
                 if txt:
                     parts.append(txt)
 
-            body = normalize_spaces(" ".join(parts))
-            body = clean_common_noise(body)
-            body = clean_electimes_noise_text(body)
-            return (body if len(body) >= 60 else ""), published
-
-    selectors = [
-        "div#article-view-content-div",
-        "div#articleBody",
-        "div.article-body",
-        "div.article-text",
-        "article",
-        "div#articleBodyContents",
-    ]
+            body = clean_electimes_noise_text(clean_common_noise(" ".join(parts)))
+            body = normalize_spaces(body)
+            return body if len(body) >= 60 else ""
+
+    # 부분 파싱(BODY_STRAINER) 트리에서는 우선순위 1·2위 div만 인정.
+    # 같은 id가 <article> 등에 붙어 있으면 트리에 남지만, 전체 파싱이었다면 ("article", {})가
+    # 문서의 첫 <article>을 골랐을 것이므로 None을 돌려 전체 파싱으로 넘김
+    containers = BODY_CONTAINERS[:2] if require_container else BODY_CONTAINERS
     body_el = None
-    for sel in selectors:
-        body_el = soup.select_one(sel)
+    for tag, attrs in containers:
+        body_el = soup.find(tag, attrs=attrs)
         if body_el:
             break
 
@@ -323,97 +463,190 @@ def extract_body_from_article(url: str, source: str) -> tuple[str, str | None]:
     if body_el:
         remove_common_blocks(body_el)
 
+        # <p>만 모음 (div/span까지 훑으면 하위 텍스트가 중복으로 쌓임)
         for p in body_el.find_all("p"):
             t = p.get_text(" ", strip=True)
             if t:
                 texts.append(t)
 
-        if len(" ".join(texts)) < 80:
-            fallback = body_el.get_text(" ", strip=True)
-            if fallback:
-                texts = [fallback]
+        # 길이 확인용으로 만든 문자열을 본문으로 그대로 사용 (join 한 번)
+        text = " ".join(texts)
+        if len(text) < 80:
+            text = body_el.get_text(" ", strip=True) or text
+    elif require_container:
+        return None
     else:
-        for p in soup.select("p"):
+        for p in SEL_P.select(soup):
             t = p.get_text(" ", strip=True)
             if t:
                 texts.append(t)
-
-    body = normalize_spaces(" ".join(texts))
-    body = clean_common_noise(body)
-    return (body if len(body) >= 60 else ""), published
+        text = " ".join(texts)
+
+    body = normalize_spaces(clean_common_noise(text))
+    return body if len(body) >= 60 else ""
+
+def extract_title_from_meta(soup: BeautifulSoup) -> str:
+    m = soup.find("meta", attrs={"property": "og:title"})
+    return normalize_spaces(m.get("content", "")) if m else ""
+
+@lru_cache(maxsize=4096)
+def extract_body_from_article(url: str, source: str) -> tuple[str, str | None, str]:
+    """(본문, 발행일, og:title) — 한 번 받아온 HTML에서 전부 뽑음
+    같은 URL이 여러 목록 페이지에 걸쳐 나와도 실행(job) 한 번에 한 번만 받아옴"""
+    fetched = fetch_html(url)
+    if fetched is None:
+        return "", None, ""
+    html, charset = fetched
+
+    # 대부분의 기사는 meta 발행일 + #article-view-content-div 본문이라 부분 파싱으로 끝남
+    meta_soup = BeautifulSoup(html, HTML_PARSER, parse_only=META_STRAINER, from_encoding=charset)
+    published = extract_published_date_from_article(meta_soup)
+    page_title = extract_title_from_meta(meta_soup)
+    body = extract_body_text(
+        BeautifulSoup(html, HTML_PARSER, parse_only=BODY_STRAINER, from_encoding=charset),
+        source, require_container=True)
+
+    if published is None or body is None:
+        soup = BeautifulSoup(html, HTML_PARSER, from_encoding=charset)
+        if published is None:
+            published = extract_published_date_from_article(soup)
+        if body is None:
+            body = extract_body_text(soup, source)
+
+    return body, published, page_title
 
 
 # ==========================================
 # 7. 목록 크롤러 (1~3페이지)
 # ==========================================
 
-def crawl_list(list_url: str, base_url: str, source: str) -> list[dict]:
+def crawl_list(list_url: str, source: str, known_urls: set[str] | None = None,
+               rejected: list[str] | None = None, today: str | None = None) -> list[dict]:
+    """known_urls: 이미 수집됐거나 확인 후 버린 기사 URL (상세 요청 없이 건너뜀)
+    rejected: 본문까지 확인하고 키워드가 없어 버린 URL을 여기에 추가
+    today: 발행일을 못 찾은 기사의 기본 날짜 (job()이 실행 시작 시점 값을 넘김)"""
     results = []
+    known_urls = known_urls or set()
+    source = sys.intern(source)
+    today = today or today_kst_str()
+
+    pages = []
+    seen = set()  # 페이지가 넘어가며 목록이 밀려 같은 기사가 두 번 나오는 경우
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as pool:
+        # 목록 페이지(1~MAX_PAGES)도 먼저 한꺼번에 요청해 두고 순서대로 처리
+        list_pages = []
+        for page in range(1, MAX_PAGES + 1):
+            page_url = list_url.format(page=page)
+            list_pages.append((page, page_url, pool.submit(get_soup, page_url, LIST_STRAINER)))
+
+        for page, page_url, list_fut in list_pages:
+            soup = list_fut.result()
+            if not soup:
+                continue
 
-    for page in range(1, MAX_PAGES + 1):
-        page_url = list_url.format(page=page)
-        soup = get_soup(page_url)
-        if not soup:
-            continue
-
-        items = soup.select("#section-list .type1 li")
-        if not items:
-            items = soup.select("#section-list li")
-
-        kept = 0
-        total = 0
-
-        for li in items:
-            try:
-                a = li.select_one("h2.titles a, h4.titles a, a.replace-titles, a[href*='articleView.html']")
-                if not a:
-                    continue
-
-                href = (a.get("href", "") or "").strip()
-                if not href:
-                    continue
-                url = href if href.startswith("http") else base_url + href
-
-                title = extract_title_from_li(li)
-                total += 1
-
-                if not title:
+            items = SEL_LIST_ITEMS.select(soup)
+            if not items:
+                items = SEL_LIST_ITEMS_FALLBACK.select(soup)
+
+            total = 0
+            known = 0
+
+            # 1) 목록에서 후보 수집 (네트워크 없음)
+            candidates = []
+            for li in items:
+                try:
+                    a = SEL_TITLE_LINK.select_one(li)
+                    if not a:
+                        continue
+
+                    href = (a.get("href", "") or "").strip()
+                    if not href:
+                        continue
+                    # 링크가 있는 목록 페이지 URL 기준으로 해석 ("/news/...", "//host/...", "articleView.html?..." 모두 처리)
+                    url = urljoin(page_url, href)
+
+                    total += 1
+                    if url in known_urls:
+                        known += 1
+                        continue
+                    if url in seen:
+                        continue
+                    seen.add(url)
+
+                    # 목록에서 제목을 못 찾으면 상세 페이지의 og:title로 채움 (아래 3단계)
+                    title = extract_title_from_li(li, a)
+
+                    # 상세 요청 전에 목록에 있는 제목+리드로 먼저 판단
+                    lead_el = SEL_LEAD.select_one(li)
+                    lead = lead_el.get_text(" ", strip=True) if lead_el else ""
+                    list_hit = is_relevant(title, lead)
+                    if not list_hit and not FETCH_BODY_ALWAYS:
+                        if DEBUG:
+                            print(f"[SKIP] {source} | {title}")
+                        continue
+
+                    list_date_el = SEL_LIST_DATE.select_one(li)
+                    list_date = parse_date_flexible(list_date_el.get_text(" ", strip=True) if list_date_el else "")
+
+                    candidates.append((title, url, list_date, list_hit))
+
+                except Exception as e:
                     if DEBUG:
-                        print(f"[WARN] {source} 제목 비어 스킵: {url}")
+                        print(f"[WARN] {source} 항목 스킵: {e}")
                     continue
 
-                body, pub_date = extract_body_from_article(url, source)
-
-                # ✅ 여기서 최종 필터링 (핵심!)
-                if not is_relevant(title, body):
+            # 2) 상세 페이지는 동시에 요청 (I/O 대기 시간 겹치기)
+            # 결과를 기다리지 않고 다음 목록 페이지로 넘어가 목록 요청과 상세 요청도 겹치게 함
+            futures = [pool.submit(extract_body_from_article, url, source) for _, url, _, _ in candidates]
+            pages.append((page, page_url, total, known, candidates, futures))
+
+        # 3) 페이지 순서 → 목록 순서대로 결과 조립
+        for page, page_url, total, known, candidates, futures in pages:
+            kept = 0
+            body_only = 0
+            for (title, url, list_date, list_hit), fut in zip(candidates, futures):
+                try:
+                    body, pub_date, page_title = fut.result()
+
+                    title = title or page_title
+                    if not title:
+                        if DEBUG:
+                            print(f"[WARN] {source} 제목 비어 스킵: {url}")
+                        continue
+
+                    # ✅ 여기서 최종 필터링 (핵심!)
+                    relevant, tags = scan_keywords(title, body)
+                    if not relevant:
+                        if DEBUG:
+                            print(f"[SKIP] {source} | {title}")
+                        # 본문을 못 받은 경우(요청 실패 등)는 다음 실행에서 다시 시도
+                        if body and rejected is not None:
+                            rejected.append(url)
+                        continue
+                    if not list_hit:
+                        body_only += 1
+
+                    # extract_body_from_article()의 본문은 이미 공백 정리된 상태
+                    subtitle = summarize_2lines(body, normalized=True)
+                    article_date = pub_date or list_date or today
+
+                    results.append({
+                        "source": source,
+                        "title": title,
+                        "url": url,
+                        "date": article_date,
+                        "tags": tags,
+                        "subtitle": subtitle,
+                        "is_important": 1 if tags else 0
+                    })
+                    kept += 1
+
+                except Exception as e:
                     if DEBUG:
-                        print(f"[SKIP] {source} | {title}")
+                        print(f"[WARN] {source} 항목 스킵: {e}")
                     continue
 
-                tags = make_tags(title + " " + body)
-                subtitle = summarize_2lines(body)
-
-                list_date_el = li.select_one("em.info.dated, em.replace-date, span.byline span")
-                list_date = parse_date_flexible(list_date_el.get_text(" ", strip=True) if list_date_el else "")
-                date = pub_date or list_date or today_kst_str()
-
-                results.append({
-                    "source": source,
-                    "title": title,
-                    "url": url,
-                    "date": date,
-                    "tags": tags,
-                    "subtitle": subtitle,
-                    "is_important": 1 if tags else 0
-                })
-                kept += 1
-
-            except Exception as e:
-                if DEBUG:
-                    print(f"[WARN] {source} 항목 스킵: {e}")
-                continue
-
-        print(f"[{source}] page {page} → {kept}건 / 목록 {total}개 | {page_url}")
+            print(f"[{source}] page {page} → {kept}건(본문에서만 매칭 {body_only}) / 목록 {total}개(기존 {known}) | {page_url}")
 
     return results
 
@@ -422,14 +655,72 @@ def crawl_list(list_url: str, base_url: str, source: str) -> list[dict]:
 # 8. 저장 로직 (all / by_date / latest(today))
 # ==========================================
 
+def dumps_json(obj) -> bytes:
+    """json.dumps(ensure_ascii=False, indent=2)와 같은 바이트 (orjson이 있으면 orjson 사용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def dump_json_if_changed(path: Path, obj) -> bool:
+    """내용이 같으면 쓰지 않음 (크기가 다르면 비교 없이 바로 씀)"""
+    data = dumps_json(obj)
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    # 임시 파일에 다 쓴 뒤 교체 → 중간에 죽어도 all.json이 잘린 채로 남지 않음
+    # (잘린 all.json은 load_all_existing()에서 []로 읽혀 누적 기사가 통째로 사라짐)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    return True
+
+def load_json(path: Path):
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    return json.loads(path.read_text(encoding="utf-8"))
+
+# 정렬 키(ARTICLE_SORT_KEY)는 itemgetter라 키가 빠진 레코드가 있으면 KeyError → 읽을 때 기본값을 채움
+ARTICLE_DEFAULTS = (("date", ""), ("is_important", 0), ("source", ""), ("title", ""))
+
+def normalize_article(it: dict) -> dict:
+    """정렬 키 기본값을 채우고, source/date/tags는 기사마다 반복되는 값이라 문자열 하나를 공유 (메모리·비교 비용 절감)"""
+    for k, default in ARTICLE_DEFAULTS:
+        it.setdefault(k, default)
+    for k in ("source", "date"):
+        v = it.get(k)
+        if isinstance(v, str):
+            it[k] = sys.intern(v)
+    tags = it.get("tags")
+    if isinstance(tags, list):
+        it["tags"] = [sys.intern(t) if isinstance(t, str) else t for t in tags]
+    return it
+
 def load_all_existing() -> list[dict]:
     if ALL_JSON_PATH.exists():
         try:
-            return json.loads(ALL_JSON_PATH.read_text(encoding="utf-8"))
+            return [normalize_article(it) for it in load_json(ALL_JSON_PATH)]
         except Exception:
             return []
     return []
 
+def load_rejected_urls() -> list[str]:
+    if REJECTED_JSON_PATH.exists():
+        try:
+            return [u for u in load_json(REJECTED_JSON_PATH) if isinstance(u, str)]
+        except Exception:
+            return []
+    return []
+
+def merge_rejected_urls(prev: list[str], new: list[str], kept_urls: set[str]) -> list[str]:
+    """오래된 것 → 최근 것 순서 유지, 수집된 기사는 제외, 최근 REJECTED_MAX개만"""
+    order = {}
+    for u in prev + new:
+        order.pop(u, None)  # 다시 나온 URL은 맨 뒤(최근)로
+        order[u] = None
+    return [u for u in order if u not in kept_urls][-REJECTED_MAX:]
+
 def dedup_by_url(items: list[dict]) -> list[dict]:
     d = {}
     for it in items:
@@ -439,46 +730,72 @@ def dedup_by_url(items: list[dict]) -> list[dict]:
     return list(d.values())
 
 def sort_articles(items: list[dict]) -> list[dict]:
-    return sorted(
-        items,
-        key=lambda x: (x.get("date", ""), x.get("is_important", 0), x.get("source", ""), x.get("title", "")),
-        reverse=True
-    )
-
-def write_by_date(items: list[dict]) -> dict[str, list[dict]]:
-    bucket: dict[str, list[dict]] = {}
-    for it in items:
-        d = it.get("date") or "unknown"
-        bucket.setdefault(d, []).append(it)
-
+    return sorted(items, key=ARTICLE_SORT_KEY, reverse=True)
+
+def article_date_key(it: dict) -> str:
+    return it.get("date") or "unknown"
+
+def write_by_date(items: list[dict], changed_dates: set[str] | None = None) -> dict[str, list[dict]]:
+    """items는 sort_articles()로 정렬된 상태여야 함 (날짜가 1순위 키라 그대로 묶으면 버킷도 정렬됨)
+    changed_dates: 이번 실행에서 기사가 추가된 날짜 (None이면 모든 버킷을 확인)"""
+    # 정렬 키와 같은 원래 date 값으로 묶고, 파일 이름 키로 합침
+    # ("unknown"과 ""는 둘 다 unknown.json이지만 정렬상 붙어 있지 않아 groupby로는 따로 나옴)
+    bucket = {}
+    for _, g in groupby(items, key=itemgetter("date")):
+        lst = list(g)
+        bucket.setdefault(article_date_key(lst[0]), []).extend(lst)
+
+    # 지난 날짜 파일은 대부분 그대로라 바뀐 버킷만 다시 씀
     for d, lst in bucket.items():
-        (BY_DATE_DIR / f"{d}.json").write_text(
-            json.dumps(sort_articles(lst), ensure_ascii=False, indent=2),
-            encoding="utf-8"
-        )
+        path = BY_DATE_DIR / f"{d}.json"
+        if changed_dates is not None and d not in changed_dates and path.exists():
+            continue
+        dump_json_if_changed(path, lst)
     return bucket
 
 def job():
-    print(f"\n[크롤링 시작] {now_str()} (KST today={today_kst_str()})")
+    # 실행 기준 날짜는 한 번만 계산 (실행 중 자정이 지나도 기본 날짜와 latest.json이 같은 날을 가리킴)
+    today = today_kst_str()
+    print(f"\n[크롤링 시작] {now_str()} (KST today={today})")
+    extract_body_from_article.cache_clear()
+
+    existing = load_all_existing()
+    rejected_prev = load_rejected_urls()
+    if REFRESH:
+        known_urls = set()
+    else:
+        known_urls = {it["url"] for it in existing if it.get("url")}
+        known_urls.update(rejected_prev)
 
-    new_items = []
-    new_items += crawl_list(ENERGY_LIST, ENERGY_BASE, "에너지신문")
-    new_items += crawl_list(GAS_LIST, GAS_BASE, "가스신문")
-    new_items += crawl_list(ELECT_LIST, ELECT_BASE, "전기신문")
+    # 세 언론사는 서로 다른 호스트라 동시에 돌려도 각 사이트 부하는 그대로
+    rejected_new = [[] for _ in SOURCES]  # 언론사별로 따로 모아 순서를 고정
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as ex:
+        futures = [ex.submit(crawl_list, list_url, source, known_urls, rej, today)
+                   for (list_url, source), rej in zip(SOURCES, rejected_new)]
+        new_items = [it for f in futures for it in f.result()]
 
     print(f"\n[신규 수집] {len(new_items)}건\n")
 
-    existing = load_all_existing()
     merged = dedup_by_url(existing + new_items)
     merged = sort_articles(merged)
 
-    ALL_JSON_PATH.write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+    # 새 기사가 없는 실행에서는 all.json을 다시 쓰지 않음 (커밋 diff도 생기지 않음)
+    dump_json_if_changed(ALL_JSON_PATH, merged)
+
+    # 신규 기사의 날짜 버킷만 내용이 바뀜
+    # (REFRESH가 아니면 기존 URL은 상세 요청 없이 건너뛰므로 기존 기사가 교체되는 일은 없음)
+    if REFRESH:
+        changed_dates = None
+    else:
+        changed_dates = {article_date_key(it) for it in new_items}
+    by_date = write_by_date(merged, changed_dates)
 
-    by_date = write_by_date(merged)
+    latest_items = by_date.get(today, [])  # 버킷은 이미 정렬된 순서
+    dump_json_if_changed(LATEST_JSON_PATH, latest_items)
 
-    today = today_kst_str()
-    latest_items = sort_articles(by_date.get(today, []))
-    LATEST_JSON_PATH.write_text(json.dumps(latest_items, ensure_ascii=False, indent=2), encoding="utf-8")
+    rejected = merge_rejected_urls(
+        rejected_prev, [u for rej in rejected_new for u in rej], {it["url"] for it in merged})
+    dump_json_if_changed(REJECTED_JSON_PATH, rejected)
 
     print(f"[저장 완료] all.json={len(merged)}건 | by_date={len(by_date)}일 | latest(today)={len(latest_items)}건")
 